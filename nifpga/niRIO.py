@@ -7,11 +7,16 @@ from .statuscheckedlibrary import (NamedArgtype,
                                    LibraryFunctionInfo,
                                    StatusCheckedLibrary,
                                    LibraryNotFoundError)
+from .status import _raise_or_warn_if_nonzero_status
 import ctypes
-from enum import Enum
+import functools
+import keyword
+import re
+import threading
+from enum import Enum, IntEnum
 
 
-class DataType(Enum):
+class DataType(IntEnum):
     """ DataType is an enumerator, with the intention of abstracting the
     association between datatypes and ctypes within the Python API.
     """
@@ -34,35 +39,45 @@ class DataType(Enum):
 
     def _return_ctype(self):
         """ Returns the associated ctype of a given datatype. """
-        _datatype_ctype = {
-            DataType.Bool: ctypes.c_uint8,
-            DataType.I8: ctypes.c_int8,
-            DataType.U8: ctypes.c_uint8,
-            DataType.I16: ctypes.c_int16,
-            DataType.U16: ctypes.c_uint16,
-            DataType.I32: ctypes.c_int32,
-            DataType.U32: ctypes.c_uint32,
-            DataType.I64: ctypes.c_int64,
-            DataType.U64: ctypes.c_uint64,
-            DataType.Sgl: ctypes.c_float,
-            DataType.Dbl: ctypes.c_double,
-            DataType.Fxp: ctypes.c_uint32,
-            DataType.Cluster: ctypes.c_uint32,
-        }
-        return _datatype_ctype[self]
+        return self.ctype
 
     def isSigned(self):
-        if self == DataType.I8 \
-           or self == DataType.I16 \
-           or self == DataType.I32 \
-           or self == DataType.I64 \
-           or self == DataType.Sgl \
-           or self == DataType.Dbl:
-            return True
-        return False
+        return self in _signed_datatypes
 
 
-class FifoPropertyType(Enum):
+_signed_datatypes = frozenset([
+    DataType.I8,
+    DataType.I16,
+    DataType.I32,
+    DataType.I64,
+    DataType.Sgl,
+    DataType.Dbl,
+])
+
+_datatype_ctype = {
+    DataType.Bool: ctypes.c_uint8,
+    DataType.I8: ctypes.c_int8,
+    DataType.U8: ctypes.c_uint8,
+    DataType.I16: ctypes.c_int16,
+    DataType.U16: ctypes.c_uint16,
+    DataType.I32: ctypes.c_int32,
+    DataType.U32: ctypes.c_uint32,
+    DataType.I64: ctypes.c_int64,
+    DataType.U64: ctypes.c_uint64,
+    DataType.Sgl: ctypes.c_float,
+    DataType.Dbl: ctypes.c_double,
+    DataType.Fxp: ctypes.c_uint32,
+    DataType.Cluster: ctypes.c_uint32,
+}
+
+# Hang each member's ctype off the member itself, so e.g.
+# DataType.U32.ctype is a plain attribute load instead of a dict lookup.
+for _datatype in DataType:
+    _datatype.ctype = _datatype_ctype[_datatype]
+del _datatype
+
+
+class FifoPropertyType(IntEnum):
     """ Types of FIFO Properties, intended to abstract away the C Type. """
     I32 = 1
     U32 = 2
@@ -75,17 +90,23 @@ class FifoPropertyType(Enum):
 
     def _return_ctype(self):
         """ Returns the associated ctype of a given property type. """
-        _propertyType_ctype = {
-            FifoPropertyType.I32: ctypes.c_int32,
-            FifoPropertyType.U32: ctypes.c_uint32,
-            FifoPropertyType.I64: ctypes.c_int64,
-            FifoPropertyType.U64: ctypes.c_uint64,
-            FifoPropertyType.Ptr: ctypes.c_void_p
-        }
-        return _propertyType_ctype[self]
+        return self.ctype
+
+
+_propertyType_ctype = {
+    FifoPropertyType.I32: ctypes.c_int32,
+    FifoPropertyType.U32: ctypes.c_uint32,
+    FifoPropertyType.I64: ctypes.c_int64,
+    FifoPropertyType.U64: ctypes.c_uint64,
+    FifoPropertyType.Ptr: ctypes.c_void_p
+}
+
+for _property_type in FifoPropertyType:
+    _property_type.ctype = _propertyType_ctype[_property_type]
+del _property_type
 
 
-class FifoProperty(Enum):
+class FifoProperty(IntEnum):
     BytesPerElement = 1  # U32
     BufferAllocationGranularityElements = 2  # U32
     BufferSizeElements = 3  # U64
@@ -100,7 +121,7 @@ class FifoProperty(Enum):
         return self.name
 
 
-class FlowControl(Enum):
+class FlowControl(IntEnum):
     """ When flow control is disabled, the FIFO no longer acts like a FIFO.
     The FIFO will overwrite data in this mode. The FPGA fully controls when
     data transfers. This can be useful when regenerating a waveform or when
@@ -116,8 +137,11 @@ class FlowControl(Enum):
     """
     EnableFlowControl = 2
 
+    # IntEnum's str() is just the value on Python 3.11+, keep Enum's.
+    __str__ = Enum.__str__
 
-class DmaBufferType(Enum):
+
+class DmaBufferType(IntEnum):
     """ Allocated by RIO means the driver take the other properties and create
     a buffer that meets their requirements.
     """
@@ -128,21 +152,36 @@ class DmaBufferType(Enum):
     """
     AllocatedByUser = 2
 
+    __str__ = Enum.__str__
 
-_fifo_properties_to_types = {
-    FifoProperty.BytesPerElement: FifoPropertyType.U32,
-    FifoProperty.BufferAllocationGranularityElements: FifoPropertyType.U32,
-    FifoProperty.BufferSizeElements: FifoPropertyType.U64,
-    FifoProperty.MirroredElements: FifoPropertyType.U64,
-    FifoProperty.DmaBufferType: FifoPropertyType.I32,
-    FifoProperty.DmaBuffer: FifoPropertyType.Ptr,
-    FifoProperty.FlowControl: FifoPropertyType.I32,
-    FifoProperty.ElementsCurrentlyAcquired: FifoPropertyType.U64,
-    FifoProperty.PreferredNumaNode: FifoPropertyType.I32,
-}
 
+# The FifoPropertyType and ctype of each FifoProperty, indexed by the
+# property's value, e.g. _fifo_property_ctypes_by_value[prop]. FifoProperty
+# values start at 1, so index 0 is unused.
+_fifo_property_types_by_value = (
+    None,
+    FifoPropertyType.U32,  # BytesPerElement
+    FifoPropertyType.U32,  # BufferAllocationGranularityElements
+    FifoPropertyType.U64,  # BufferSizeElements
+    FifoPropertyType.U64,  # MirroredElements
+    FifoPropertyType.I32,  # DmaBufferType
+    FifoPropertyType.Ptr,  # DmaBuffer
+    FifoPropertyType.I32,  # FlowControl
+    FifoPropertyType.U64,  # ElementsCurrentlyAcquired
+    FifoPropertyType.I32,  # PreferredNumaNode
+)
+_fifo_property_ctypes_by_value = tuple(
+    None if prop_type is None else prop_type._return_ctype()
+    for prop_type in _fifo_property_types_by_value)
+
+# Likewise each property's type and ctype.
+for _prop in FifoProperty:
+    _prop.type = _fifo_property_types_by_value[_prop]
+    _prop.ctype = _fifo_property_ctypes_by_value[_prop]
+del _prop
 
-class FpgaViState(Enum):
+
+class FpgaViState(IntEnum):
     """ The FPGA VI has either been downloaded and not run, or the VI was aborted
     or reset. """
     NotRunning = 0
@@ -154,6 +193,8 @@ class FpgaViState(Enum):
     but instead reached the end of any loops it was executing and ended. """
     NaturallyStopped = 3
 
+    __str__ = Enum.__str__
+
 
 _SessionType = ctypes.c_uint32
 _IrqContextType = ctypes.c_void_p
@@ -164,6 +205,90 @@ RUN_ATTRIBUTE_WAIT_UNTIL_DONE = 1
 CLOSE_ATTRIBUTE_NO_RESET_IF_LAST_SESSION = 1
 INFINITE_TIMEOUT = 0xffffffff
 
+# platform.system().lower() -> advice for when the library can't be loaded
+_library_not_found_messages = {
+    'windows':
+        "Unable to find NiFpga.dll on your system, "
+        "ensure you have installed the relevent RIO distribution for your device. "
+        "Search for your product here: http://www.ni.com/downloads/ni-drivers/ ",
+    'linux':
+        "Unable to find libNiFpga.so on your system, "
+        "If you are on desktop linux, ensure you have installed the latest "
+        "RIO Linux distribution for your product, such as https://www.ni.com/en-us/support/downloads/drivers/download.ni-linux-device-drivers.html "
+        "If you are on a Linux RT embedded target (cRIO, sbRIO, FlexRIO, Industrial Controller, etc) install NI-RIO to your target "
+        "though MAX following these instructions: https://www.ni.com/getting-started/set-up-hardware/compactrio/controller-software ",
+    'darwin':
+        "Unable to find NiFpga.Framework on your system, "
+        "Sorry we don't yet support using RIO Devices on OSX, contact your sales person "
+        "for the latest information on OSX support. ",
+}
+
+
+_thread_local = threading.local()
+
+
+def _route_ticket_buffer():
+    """ Returns the calling thread's reusable route ticket buffer. """
+    try:
+        return _thread_local.route_ticket
+    except AttributeError:
+        _thread_local.route_ticket = ctypes.c_int32()
+        return _thread_local.route_ticket
+
+
+_specialized_wrapper_template = """
+def %(name)s(%(args)s):
+    _status = _function(%(args)s)
+    if _status:
+        _raise_or_warn(_status, _function_name, _argument_names, (%(args_tuple)s))
+"""
+
+
+def _as_identifier(name):
+    """ Returns name with anything that can't be in a Python identifier
+    replaced by '_', e.g. "elements requested " -> "elements_requested". """
+    return re.sub(r"\W", "_", name.strip())
+
+
+def _specialize_status_check(function_info):
+    """
+    Returns function_info's function wrapped with a status check, like
+    check_status(), but generated for the function's exact arguments. This
+    skips the *args packing and argument count check that the generic
+    check_status() wrapper does on every call. Called with the wrong
+    arguments, Python raises its usual TypeError naming the entry point and
+    the argument, e.g. "niFlexRio_RouteSignal() missing 1 required
+    positional argument: 'routeTicket'".
+    """
+    function_name = function_info.function.__name__
+    args = []
+    for i, argument_name in enumerate(function_info.argument_names):
+        arg = _as_identifier(argument_name)
+        # the generated code's own names all start with '_'
+        if (not arg or arg[0] == "_" or arg[0].isdigit()
+                or keyword.iskeyword(arg) or arg in args):
+            arg = "arg%u" % i
+        args.append(arg)
+    name = _as_identifier(function_name)
+    if not name or name[0].isdigit() or keyword.iskeyword(name):
+        name = "wrapper"
+    source = _specialized_wrapper_template % {
+        "name": name,
+        "args": ", ".join(args),
+        "args_tuple": "".join(arg + ", " for arg in args),
+    }
+    namespace = {
+        "_function": function_info.function,
+        "_function_name": function_name,
+        "_argument_names": function_info.argument_names,
+        "_raise_or_warn": _raise_or_warn_if_nonzero_status,
+    }
+    exec(compile(source, "<%s wrapper>" % function_info.name, "exec"), namespace)
+    return functools.update_wrapper(namespace[name], function_info.function)
+
+
+_batch_library_not_loaded = object()
+
 
 class _NiRIO(StatusCheckedLibrary):
     """
@@ -190,32 +315,142 @@ class _NiRIO(StatusCheckedLibrary):
                     NamedArgtype("destination", ctypes.c_char_p),
                     NamedArgtype("routeTicket", ctypes.POINTER(ctypes.c_int32)),
                 ]),
-                    ]  # list of function_infos
-        
+        ]  # list of function_infos
+
+        # the optional nirio_batch helper, loaded by _get_batch_library()
+        self._batch_library = _batch_library_not_loaded
         try:
+            # Entry points are only looked up when first called, most
+            # scripts only use a handful of them.
             super(_NiRIO, self).__init__(library_name="NIFLEXRIOAPI",
-                                          library_function_infos=library_function_infos)
+                                         library_function_infos=library_function_infos,
+                                         lazy=True)
         except LibraryNotFoundError as e:
             import platform
-            system = platform.system().lower()
-            if system == 'windows':
-                raise LibraryNotFoundError(
-                    "Unable to find NiFpga.dll on your system, "
-                    "ensure you have installed the relevent RIO distribution for your device. "
-                    "Search for your product here: http://www.ni.com/downloads/ni-drivers/ "
-                    "Original Exception: " + str(e))
-            if system == 'linux':
-                raise LibraryNotFoundError(
-                    "Unable to find libNiFpga.so on your system, "
-                    "If you are on desktop linux, ensure you have installed the latest "
-                    "RIO Linux distribution for your product, such as https://www.ni.com/en-us/support/downloads/drivers/download.ni-linux-device-drivers.html "
-                    "If you are on a Linux RT embedded target (cRIO, sbRIO, FlexRIO, Industrial Controller, etc) install NI-RIO to your target "
-                    "though MAX following these instructions: https://www.ni.com/getting-started/set-up-hardware/compactrio/controller-software "
-                    "Original Exception: " + str(e))
-            if system == 'darwin':
-                raise LibraryNotFoundError(
-                    "Unable to find NiFpga.Framework on your system, "
-                    "Sorry we don't yet support using RIO Devices on OSX, contact your sales person "
-                    "for the latest information on OSX support. "
-                    "Original Exception: " + str(e))
-            raise
+            message = _library_not_found_messages.get(platform.system().lower())
+            if message is None:
+                raise
+            raise LibraryNotFoundError(message + "Original Exception: " + str(e))
+
+    def _wrap_function(self, function_info):
+        return _specialize_status_check(function_info)
+
+    def _get_batch_library(self):
+        """ Loads the optional nirio_batch helper library (see nirio_batch.c)
+        the first time it's needed. Returns None if it isn't installed, if
+        it can't be loaded, or if it doesn't export nirio_route_many. """
+        if self._batch_library is _batch_library_not_loaded:
+            try:
+                batch_library = StatusCheckedLibrary(
+                    library_name="nirio_batch",
+                    library_function_infos=[
+                        LibraryFunctionInfo(
+                            pretty_name="RouteMany",
+                            name_in_library="nirio_route_many",
+                            named_argtypes=[
+                                NamedArgtype("session", _SessionType),
+                                NamedArgtype("sources", ctypes.POINTER(ctypes.c_char_p)),
+                                NamedArgtype("destinations", ctypes.POINTER(ctypes.c_char_p)),
+                                NamedArgtype("routeTickets", ctypes.POINTER(ctypes.c_int32)),
+                                NamedArgtype("count", ctypes.c_size_t),
+                            ]),
+                    ])
+            except (LibraryNotFoundError, OSError):
+                # OSError: found, but not loadable, e.g. built for another
+                # architecture or against a missing NIFLEXRIOAPI
+                batch_library = None
+            # A stale or wrong build without nirio_route_many would only ever
+            # return VersionMismatch, so route from Python instead.
+            if batch_library is not None and not hasattr(batch_library._library, "nirio_route_many"):
+                batch_library = None
+            self._batch_library = batch_library
+        return self._batch_library
+
+    def BatchRouteSignal(self, session, sources, destinations):
+        """ Routes each source to the destination at the same index.
+
+        If the optional nirio_batch helper library is installed, the whole
+        batch is routed with a single call into it. The batch then stops at
+        the first error, and only the first warning is reported.
+        Otherwise the Route_Signal entry point is looked up once for the whole
+        batch and every route uses the calling thread's route ticket buffer.
+
+        Args:
+            session (int): The session to route signals on.
+            sources (list): Source terminal names, as bytes.
+            destinations (list): Destination terminal names, as bytes.
+
+        Returns:
+            route_tickets (list): The route ticket of each route, in order.
+        """
+        if len(sources) != len(destinations):
+            raise ValueError("BatchRouteSignal requires the same number of "
+                             "sources (%u) and destinations (%u)"
+                             % (len(sources), len(destinations)))
+        batch_library = self._get_batch_library()
+        if batch_library is not None:
+            count = len(sources)
+            route_tickets = (ctypes.c_int32 * count)()
+            batch_library.RouteMany(session,
+                                    (ctypes.c_char_p * count)(*sources),
+                                    (ctypes.c_char_p * count)(*destinations),
+                                    route_tickets,
+                                    count)
+            return route_tickets[:]
+        route_signal = self["Route_Signal"]
+        route_ticket = _route_ticket_buffer()
+        route_tickets = []
+        for source, destination in zip(sources, destinations):
+            route_signal(session, source, destination, route_ticket)
+            route_tickets.append(route_ticket.value)
+        return route_tickets
+
+
+class RouteSession(object):
+    """
+    Routes signals on a single session, keeping everything but the call
+    itself around between routes: the Route_Signal entry point and the
+    terminal names already encoded for C. Route tickets are returned
+    through the calling thread's route ticket buffer, so a RouteSession
+    can be shared between threads.
+
+    Useful when the same terminals are routed over and over, e.g.:
+        routes = RouteSession(nirio, session)
+        ticket = routes.route("SigIn0", "ClkOut")
+    """
+    __slots__ = ("session", "_route_signal", "_terminals")
+
+    def __init__(self, nirio, session):
+        """
+        Args:
+            nirio (_NiRIO): The library to route signals with.
+            session (int): The session to route signals on.
+        """
+        self.session = session
+        self._route_signal = nirio["Route_Signal"]
+        # terminal name -> ctypes.c_char_p of the encoded name
+        self._terminals = {}
+
+    def _terminal(self, name):
+        terminal = self._terminals.get(name)
+        if terminal is None:
+            encoded = name if isinstance(name, bytes) else name.encode("ascii")
+            terminal = self._terminals[name] = ctypes.c_char_p(encoded)
+        return terminal
+
+    def route(self, source, destination):
+        """ Routes source to destination.
+
+        Args:
+            source (str): The source terminal name, e.g. "SigIn0".
+            destination (str): The destination terminal name, e.g. "ClkOut".
+
+        Returns:
+            route_ticket (int): The route ticket for the new route.
+        """
+        route_ticket = _route_ticket_buffer()
+        self._route_signal(self.session,
+                           self._terminal(source),
+                           self._terminal(destination),
+                           route_ticket)
+        return route_ticket.value
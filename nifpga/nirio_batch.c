@@ -0,0 +1,55 @@
+/*
+ * nirio_batch, an optional helper library for _NiRIO.BatchRouteSignal
+ *
+ * Routes a whole batch of signals in one call from Python instead of one
+ * ctypes call per route. It isn't built with the nifpga package; build it
+ * against the NI-RIO driver wherever it's needed and put it somewhere
+ * ctypes.util.find_library("nirio_batch") will find it, e.g. on Linux:
+ *
+ *     cc -shared -fPIC -O2 -o libnirio_batch.so nirio_batch.c -lNIFLEXRIOAPI
+ *
+ * When it can't be found, BatchRouteSignal falls back to calling
+ * niFlexRio_RouteSignal once per route from Python.
+ */
+#include <stddef.h>
+#include <stdint.h>
+
+#if defined(_WIN32)
+#define NIRIO_BATCH_EXPORT __declspec(dllexport)
+#else
+#define NIRIO_BATCH_EXPORT
+#endif
+
+int32_t niFlexRio_RouteSignal(uint32_t session,
+                              const char* source,
+                              const char* destination,
+                              int32_t* routeTicket);
+
+/*
+ * Routes sources[i] to destinations[i] for every i < count, storing each
+ * route ticket in routeTickets[i].
+ *
+ * Stops at and returns the first error (negative status). Otherwise returns
+ * the first warning (positive status), or 0 if every route succeeded.
+ */
+NIRIO_BATCH_EXPORT int32_t nirio_route_many(uint32_t session,
+                                            const char* const* sources,
+                                            const char* const* destinations,
+                                            int32_t* routeTickets,
+                                            size_t count)
+{
+    int32_t warning = 0;
+    size_t i;
+    for (i = 0; i < count; i++)
+    {
+        int32_t status = niFlexRio_RouteSignal(session,
+                                               sources[i],
+                                               destinations[i],
+                                               &routeTickets[i]);
+        if (status < 0)
+            return status;
+        if (status > 0 && warning == 0)
+            warning = status;
+    }
+    return warning;
+}
@@ -438,8 +438,10 @@ class _ArrayRegister(_Register):
         """
         buf = self._ctype_type()
         self._read_func(self._session, self._resource, buf, len(self))
-        val = [bool(elem) if self._datatype is DataType.Bool else elem for elem in buf]
-        return val
+        if self._datatype is DataType.Bool:
+            return [bool(elem) for elem in buf]
+        # Slicing a ctypes array converts every element in C.
+        return buf[:]
 
 
 class _DataConvertingRegister(_Register):
@@ -484,7 +486,7 @@ class _DataConvertingRegister(_Register):
         """
         buf = self._ctype_type()
         self._read_func(self._session, self._resource, buf, self._transfer_len)
-        read_array = [elem for elem in buf]
+        read_array = buf[:]
         fpga_representation = self._combine_array_of_u32_into_one_value(read_array)
         return self._type.unpack_data(fpga_representation)
 
@@ -666,7 +668,7 @@ class _FIFO(object):
         if self._datatype is DataType.Bool:
             data = [bool(elem) for elem in buf]
         else:
-            data = [elem for elem in buf]
+            data = buf[:]
         return self.ReadValues(data=data,
                                elements_remaining=elements_remaining.value)
 
@@ -91,13 +91,19 @@ def check_status(function_name, argument_names):
         (e.g. 'e.get_args()["session"]').
     """
     def decorator(function):
+        # argtypes are bound once when the library is loaded, so look up the
+        # expected argument count here rather than on every call.
+        argtypes = getattr(function, "argtypes", None)
+        number_of_args = None if argtypes is None else len(argtypes)
+
         @functools.wraps(function)
         def internal(*args):
-            if hasattr(function, "argtypes") and len(args) != len(function.argtypes):
+            if number_of_args is not None and len(args) != number_of_args:
                 raise TypeError("%s takes exactly %u arguments (%u given)"
-                                % (function_name, len(function.argtypes), len(args)))
+                                % (function_name, number_of_args, len(args)))
             status = function(*args)
-            _raise_or_warn_if_nonzero_status(status, function_name, argument_names, args)
+            if status:
+                _raise_or_warn_if_nonzero_status(status, function_name, argument_names, args)
         return internal
     return decorator
 
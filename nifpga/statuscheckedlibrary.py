@@ -1,6 +1,7 @@
 from .status import check_status, VersionMismatchError
 import ctypes
 import ctypes.util
+import threading
 
 StatusType = ctypes.c_int32
 
@@ -79,16 +80,28 @@ class StatusCheckedFunctions(object):
         # function with a status check
         self._wrapped_functions = {}
         for function_info in function_infos:
-            decorator = check_status(function_info.function.__name__,
-                                     function_info.argument_names)
-            closure = decorator(function_info.function)
+            self._add_function(function_info)
 
-            # e.g. "self.Open = closure"
-            # So now "<this object>.Open(...)" works
-            setattr(self, function_info.name, closure)
+    def _wrap_function(self, function_info):
+        """ Returns function_info's function wrapped with a status check.
 
-            # Store closure this so __getitem__ can provide more convenience
-            self._wrapped_functions[function_info.name] = closure
+        Subclasses can override this to change how functions are wrapped.
+        """
+        decorator = check_status(function_info.function.__name__,
+                                 function_info.argument_names)
+        return decorator(function_info.function)
+
+    def _add_function(self, function_info):
+        """ Wraps function_info's function with a status check and makes it
+        callable by function_info's name. """
+        closure = self._wrap_function(function_info)
+
+        # e.g. "self.Open = closure"
+        # So now "<this object>.Open(...)" works
+        setattr(self, function_info.name, closure)
+
+        # Store closure this so __getitem__ can provide more convenience
+        self._wrapped_functions[function_info.name] = closure
 
     def __getitem__(self, key):
         """
@@ -140,13 +153,36 @@ class LibraryNotFoundError(RuntimeError):
     pass
 
 
+class _ResolvingDict(dict):
+    """ A dict that calls 'resolve(key)' to fill in a missing key. """
+    def __init__(self, resolve):
+        super(_ResolvingDict, self).__init__()
+        self._resolve = resolve
+
+    def __missing__(self, key):
+        self._resolve(key)
+        return dict.__getitem__(self, key)
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
 class StatusCheckedLibrary(StatusCheckedFunctions):
-    def __init__(self, library_name, library_function_infos):
+    def __init__(self, library_name, library_function_infos, lazy=False):
         """
         Raises exceptions from entry points that return NiFpga_Status codes.
 
         library_name: e.g. "NiFpga" (libNiFpga.so, NiFpga.dll)
         library_function_infos: a list of library_function_info objects
+        lazy: if True, don't look up and wrap each entry point until it is
+            first used, so a caller that only uses a few entry points of a
+            large library doesn't pay to bind all of them.
 
         Automatically wraps each entry point named in library_function_infos
         with a closure that raises an appropriate derived class of
@@ -169,31 +205,85 @@ class StatusCheckedLibrary(StatusCheckedFunctions):
             # argument.
             cool_library.AwesomeFunction(7)
             cool_library["AwesomeFunction"](7)
+
+        The entry points themselves, with argtypes and restype already
+        bound but without the status check, are kept in _prebuilt by
+        pretty_name for callers that check the returned status themselves:
+            status = cool_library._prebuilt["AwesomeFunction"](7)
         """
         library = ctypes.util.find_library(library_name)
         if library is None:
             raise LibraryNotFoundError(library_name)
-        library = ctypes.cdll.LoadLibrary(library)
-        function_infos = []
-        for lfi in library_function_infos:
-            try:
-                func = getattr(library, lfi.name_in_library)  # i.e., dlsym()
-                # ctypes functions have special 'argtypes' and 'restype' fields
-                # that we set, so ctypes can automatically convert types and knows
-                # how to call into the library.
-                func.argtypes = [named_argtype.argtype for named_argtype in lfi.named_argtypes]
-                # Assume that everything returns an NiFpga_Status
-                func.restype = StatusType
-            except AttributeError:
-                # if we can't find the symbol, instead insert a function that
-                # always returns the VersionMismatch error, that way they can
-                # use the rest of the API
-                def returnsVersionMismatchError(*args, **kwargs):
-                    """ Always returns the version mismatch error code. """
-                    return VersionMismatchError.CODE
-                func = returnsVersionMismatchError
-            function_infos.append(
-                FunctionInfo(function=func,
-                             name=lfi.pretty_name,
-                             argument_names=[named_argtype.name for named_argtype in lfi.named_argtypes]))
+        self._library = ctypes.cdll.LoadLibrary(library)
+        # pretty_name -> entry point with argtypes and restype bound
+        self._prebuilt = _ResolvingDict(self._resolve)
+        # pretty_name -> LibraryFunctionInfo not yet looked up in the library
+        self._pending_function_infos = {}
+        # so two threads using an entry point for the first time don't both
+        # try to resolve it
+        self._resolve_lock = threading.Lock()
+        if lazy:
+            for lfi in library_function_infos:
+                self._pending_function_infos[lfi.pretty_name] = lfi
+            function_infos = []
+        else:
+            function_infos = [self._load_function(lfi) for lfi in library_function_infos]
         super(StatusCheckedLibrary, self).__init__(function_infos)
+
+    def _load_function(self, lfi):
+        """ Looks up the entry point described by lfi in the library and
+        returns a FunctionInfo for it. """
+        try:
+            func = getattr(self._library, lfi.name_in_library)  # i.e., dlsym()
+            # ctypes functions have special 'argtypes' and 'restype' fields
+            # that we set, so ctypes can automatically convert types and knows
+            # how to call into the library.
+            func.argtypes = [named_argtype.argtype for named_argtype in lfi.named_argtypes]
+            # Assume that everything returns an NiFpga_Status
+            func.restype = StatusType
+        except AttributeError:
+            # if we can't find the symbol, instead insert a function that
+            # always returns the VersionMismatch error, that way they can
+            # use the rest of the API
+            def returnsVersionMismatchError(*args, **kwargs):
+                """ Always returns the version mismatch error code. """
+                return VersionMismatchError.CODE
+            func = returnsVersionMismatchError
+        self._prebuilt[lfi.pretty_name] = func
+        return FunctionInfo(function=func,
+                            name=lfi.pretty_name,
+                            argument_names=[named_argtype.name for named_argtype in lfi.named_argtypes])
+
+    def _resolve(self, pretty_name):
+        """ Looks up and wraps an entry point deferred by 'lazy'.
+
+        Does nothing if another thread already resolved it, and raises
+        KeyError if pretty_name isn't an entry point of this library.
+        """
+        with self._resolve_lock:
+            if pretty_name in self._wrapped_functions:
+                return
+            lfi = self._pending_function_infos.pop(pretty_name, None)
+            if lfi is None:
+                raise KeyError(pretty_name)
+            self._add_function(self._load_function(lfi))
+
+    def __getitem__(self, key):
+        try:
+            return self._wrapped_functions[key]
+        except KeyError:
+            self._resolve(key)
+            return self._wrapped_functions[key]
+
+    def __getattr__(self, name):
+        """ Only called when 'name' isn't found normally, so this is where
+        entry points deferred by 'lazy' are resolved for '<this object>.Name'.
+        """
+        # __init__ hasn't set up resolving yet (e.g. during copy or unpickling)
+        if "_resolve_lock" not in self.__dict__:
+            raise AttributeError(name)
+        try:
+            self._resolve(name)
+        except KeyError:
+            raise AttributeError(name)
+        return self._wrapped_functions[name]
@@ -0,0 +1,280 @@
+import ctypes
+import mock
+import threading
+import unittest
+import warnings
+
+import nifpga
+from nifpga.niRIO import (_NiRIO, _batch_library_not_loaded,
+                          _fifo_property_ctypes_by_value,
+                          _fifo_property_types_by_value,
+                          _route_ticket_buffer, DataType,
+                          DmaBufferType, FifoProperty, FifoPropertyType,
+                          FlowControl, FpgaViState, RouteSession)
+from nifpga.statuscheckedlibrary import LibraryNotFoundError
+
+
+class DataTypeTest(unittest.TestCase):
+    def test_every_datatype_has_a_ctype(self):
+        for datatype in DataType:
+            self.assertTrue(issubclass(datatype._return_ctype(), ctypes._SimpleCData))
+        self.assertIs(ctypes.c_int16, DataType.I16._return_ctype())
+        self.assertIs(ctypes.c_double, DataType.Dbl._return_ctype())
+
+    def test_ctype_attribute(self):
+        for datatype in DataType:
+            self.assertIs(datatype._return_ctype(), datatype.ctype)
+        self.assertIs(ctypes.c_uint8, DataType.Bool.ctype)
+
+    def test_is_signed(self):
+        signed = [datatype for datatype in DataType if datatype.isSigned()]
+        self.assertEqual([DataType.I8, DataType.I16, DataType.I32,
+                          DataType.I64, DataType.Sgl, DataType.Dbl], signed)
+
+
+class FifoPropertyTypeTest(unittest.TestCase):
+    def test_every_property_type_has_a_ctype(self):
+        for property_type in FifoPropertyType:
+            self.assertTrue(issubclass(property_type._return_ctype(), ctypes._SimpleCData))
+        self.assertIs(ctypes.c_void_p, FifoPropertyType.Ptr._return_ctype())
+
+    def test_ctype_attribute(self):
+        for property_type in FifoPropertyType:
+            self.assertIs(property_type._return_ctype(), property_type.ctype)
+        self.assertIs(ctypes.c_uint64, FifoPropertyType.U64.ctype)
+
+
+class FifoPropertyTest(unittest.TestCase):
+    def test_type_and_ctype_attributes(self):
+        for prop in FifoProperty:
+            self.assertIsInstance(prop.type, FifoPropertyType)
+            self.assertIs(prop.type._return_ctype(), prop.ctype)
+        self.assertIs(FifoPropertyType.U32, FifoProperty.BytesPerElement.type)
+        self.assertIs(ctypes.c_uint64, FifoProperty.BufferSizeElements.ctype)
+        self.assertIs(FifoPropertyType.Ptr, FifoProperty.DmaBuffer.type)
+        self.assertIs(ctypes.c_int32, FifoProperty.PreferredNumaNode.ctype)
+
+    def test_lookup_by_value(self):
+        self.assertEqual(len(FifoProperty) + 1, len(_fifo_property_types_by_value))
+        for prop in FifoProperty:
+            self.assertIs(prop.type, _fifo_property_types_by_value[prop.value])
+            self.assertIs(prop.ctype, _fifo_property_ctypes_by_value[prop.value])
+
+
+class IntEnumTest(unittest.TestCase):
+    def test_members_pass_straight_to_ctypes(self):
+        self.assertEqual(7, ctypes.c_uint32(DataType.U32).value)
+        self.assertEqual(6, ctypes.c_uint32(FifoProperty.DmaBuffer).value)
+        self.assertEqual(2, ctypes.c_int32(FlowControl.EnableFlowControl).value)
+
+    def test_str_is_unchanged(self):
+        self.assertEqual("U32", str(DataType.U32))
+        self.assertEqual("Ptr", str(FifoPropertyType.Ptr))
+        self.assertEqual("DmaBuffer", str(FifoProperty.DmaBuffer))
+        self.assertEqual("FlowControl.EnableFlowControl", str(FlowControl.EnableFlowControl))
+        self.assertEqual("DmaBufferType.AllocatedByUser", str(DmaBufferType.AllocatedByUser))
+        self.assertEqual("FpgaViState.Running", str(FpgaViState.Running))
+
+
+class RouteTicketBufferTest(unittest.TestCase):
+    def test_reused_within_a_thread(self):
+        self.assertIs(_route_ticket_buffer(), _route_ticket_buffer())
+
+    def test_separate_per_thread(self):
+        buffers = []
+        thread = threading.Thread(target=lambda: buffers.append(_route_ticket_buffer()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(_route_ticket_buffer(), buffers[0])
+
+
+class NiRIOLibraryNotFoundTest(unittest.TestCase):
+    @mock.patch('nifpga.statuscheckedlibrary.ctypes.util.find_library', return_value=None)
+    def test_platform_specific_message(self, mock_find_library):
+        with mock.patch('platform.system', return_value="Linux"):
+            with self.assertRaises(LibraryNotFoundError) as context:
+                _NiRIO()
+        self.assertIn("Unable to find libNiFpga.so", str(context.exception))
+        self.assertIn("Original Exception: NIFLEXRIOAPI", str(context.exception))
+
+    @mock.patch('nifpga.statuscheckedlibrary.ctypes.util.find_library', return_value=None)
+    def test_unknown_platform_reraises(self, mock_find_library):
+        with mock.patch('platform.system', return_value="Plan9"):
+            with self.assertRaises(LibraryNotFoundError) as context:
+                _NiRIO()
+        self.assertEqual("NIFLEXRIOAPI", str(context.exception))
+
+
+class NiRIOTestMockedLibrary(unittest.TestCase):
+    """
+    NIFLEXRIOAPI is only available with the NI-RIO driver installed, so
+    these tests load _NiRIO against a mocked library whose
+    niFlexRio_RouteSignal hands out increasing route tickets.
+    """
+    # so nose shows test names instead of docstrings
+    def shortDescription(self):
+        return None
+
+    @mock.patch('nifpga.statuscheckedlibrary.ctypes.util.find_library')
+    @mock.patch('nifpga.statuscheckedlibrary.ctypes.cdll')
+    def setUp(self, mock_cdll, mock_find_library):
+        self._routes = []
+
+        def route_signal(session, source, destination, route_ticket):
+            # unwrap any ctypes.c_char_p so routes compare as plain bytes
+            self._routes.append((session,
+                                 getattr(source, "value", source),
+                                 getattr(destination, "value", destination)))
+            route_ticket.value = len(self._routes)
+            return self._mock_route_signal.status
+
+        self._mock_route_signal = mock.Mock(side_effect=route_signal)
+        self._mock_route_signal.__name__ = "niFlexRio_RouteSignal"
+        self._mock_route_signal.status = 0
+        mock_loaded_library = mock.Mock()
+        mock_loaded_library.niFlexRio_RouteSignal = self._mock_route_signal
+        mock_cdll.LoadLibrary.return_value = mock_loaded_library
+        self._nirio = _NiRIO()
+        # no nirio_batch helper unless a test installs one
+        self._nirio._batch_library = None
+
+    @mock.patch('nifpga.statuscheckedlibrary.ctypes.util.find_library')
+    @mock.patch('nifpga.statuscheckedlibrary.ctypes.cdll')
+    def _use_batch_library(self, mock_cdll, mock_find_library):
+        """ Has BatchRouteSignal use a mocked nirio_batch helper that routes
+        into the same list of routes as the mocked Route_Signal. """
+        def route_many(session, sources, destinations, route_tickets, count):
+            for i in range(count):
+                self._routes.append((session, sources[i], destinations[i]))
+                route_tickets[i] = len(self._routes)
+            return self._mock_route_many.status
+
+        self._mock_route_many = mock.Mock(side_effect=route_many)
+        self._mock_route_many.__name__ = "nirio_route_many"
+        self._mock_route_many.status = 0
+        mock_loaded_library = mock.Mock()
+        mock_loaded_library.nirio_route_many = self._mock_route_many
+        mock_cdll.LoadLibrary.return_value = mock_loaded_library
+        self._nirio._batch_library = _batch_library_not_loaded
+        self.assertIsNotNone(self._nirio._get_batch_library())
+
+    def test_route_signal_resolved_on_first_use(self):
+        self.assertEqual({}, self._nirio._wrapped_functions)
+        self._nirio.Route_Signal(7, b"SigIn0", b"ClkOut", ctypes.c_int32())
+        self.assertEqual([(7, b"SigIn0", b"ClkOut")], self._routes)
+        self.assertIn("Route_Signal", self._nirio._wrapped_functions)
+
+    def test_route_signal_wrong_number_of_arguments(self):
+        with self.assertRaises(TypeError) as context:
+            self._nirio.Route_Signal(7, b"SigIn0", b"ClkOut")
+        self.assertIn("niFlexRio_RouteSignal()", str(context.exception))
+        self.assertIn("'routeTicket'", str(context.exception))
+        self.assertEqual([], self._routes)
+
+    def test_route_signal_error_names_arguments(self):
+        self._mock_route_signal.status = -52000
+        try:
+            self._nirio["Route_Signal"](7, b"SigIn0", b"ClkOut", ctypes.c_int32())
+            self.fail("Route_Signal should have raised MemoryFull")
+        except nifpga.MemoryFullError as e:
+            self.assertEqual("niFlexRio_RouteSignal", e.get_function_name())
+            self.assertEqual(7, e.get_args()["session"])
+            self.assertEqual(b"ClkOut", e.get_args()["destination"])
+
+    def test_route_signal_warning(self):
+        self._mock_route_signal.status = 61003
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            self._nirio.Route_Signal(7, b"SigIn0", b"ClkOut", ctypes.c_int32())
+        self.assertEqual(1, len(w))
+        self.assertIsInstance(w[0].message, nifpga.FpgaAlreadyRunningWarning)
+
+    def test_batch_route_signal(self):
+        tickets = self._nirio.BatchRouteSignal(7, [b"SigIn0", b"SigIn1"],
+                                               [b"ClkOut", b"PXI_Trig0"])
+        self.assertEqual([1, 2], tickets)
+        self.assertEqual([(7, b"SigIn0", b"ClkOut"), (7, b"SigIn1", b"PXI_Trig0")],
+                         self._routes)
+
+    def test_batch_route_signal_mismatched_lengths(self):
+        with self.assertRaises(ValueError):
+            self._nirio.BatchRouteSignal(7, [b"SigIn0", b"SigIn1"], [b"ClkOut"])
+        self.assertEqual([], self._routes)
+
+    def test_batch_route_signal_uses_batch_library(self):
+        self._use_batch_library()
+        tickets = self._nirio.BatchRouteSignal(7, [b"SigIn0", b"SigIn1"],
+                                               [b"ClkOut", b"PXI_Trig0"])
+        self.assertEqual([1, 2], tickets)
+        self.assertEqual([(7, b"SigIn0", b"ClkOut"), (7, b"SigIn1", b"PXI_Trig0")],
+                         self._routes)
+        self.assertEqual(1, self._mock_route_many.call_count)
+        self.assertFalse(self._mock_route_signal.called)
+
+    def test_batch_route_signal_raises_on_batch_library_error(self):
+        self._use_batch_library()
+        self._mock_route_many.status = -52000
+        with self.assertRaises(nifpga.MemoryFullError):
+            self._nirio.BatchRouteSignal(7, [b"SigIn0"], [b"ClkOut"])
+
+    @mock.patch('nifpga.statuscheckedlibrary.ctypes.util.find_library', return_value=None)
+    def test_batch_library_not_installed(self, mock_find_library):
+        self._nirio._batch_library = _batch_library_not_loaded
+        self.assertIsNone(self._nirio._get_batch_library())
+        self.assertEqual([1], self._nirio.BatchRouteSignal(7, [b"SigIn0"], [b"ClkOut"]))
+        mock_find_library.assert_called_once_with("nirio_batch")
+
+    @mock.patch('nifpga.statuscheckedlibrary.ctypes.util.find_library')
+    @mock.patch('nifpga.statuscheckedlibrary.ctypes.cdll')
+    def test_batch_library_without_route_many(self, mock_cdll, mock_find_library):
+        # a nirio_batch library that doesn't export nirio_route_many
+        mock_cdll.LoadLibrary.return_value = mock.Mock(spec=[])
+        self._nirio._batch_library = _batch_library_not_loaded
+        self.assertIsNone(self._nirio._get_batch_library())
+        self.assertEqual([1, 2], self._nirio.BatchRouteSignal(7, [b"SigIn0", b"SigIn1"],
+                                                              [b"ClkOut", b"PXI_Trig0"]))
+        self.assertEqual(2, self._mock_route_signal.call_count)
+
+    @mock.patch('nifpga.statuscheckedlibrary.ctypes.util.find_library')
+    @mock.patch('nifpga.statuscheckedlibrary.ctypes.cdll')
+    def test_batch_library_not_loadable(self, mock_cdll, mock_find_library):
+        # a nirio_batch library that's found, but can't be loaded
+        mock_cdll.LoadLibrary.side_effect = OSError("file too short")
+        self._nirio._batch_library = _batch_library_not_loaded
+        self.assertEqual([1, 2], self._nirio.BatchRouteSignal(7, [b"SigIn0", b"SigIn1"],
+                                                              [b"ClkOut", b"PXI_Trig0"]))
+        self.assertEqual([3], self._nirio.BatchRouteSignal(7, [b"SigIn2"], [b"PXI_Trig1"]))
+        self.assertEqual(3, self._mock_route_signal.call_count)
+        # only tried to load it once
+        self.assertEqual(1, mock_cdll.LoadLibrary.call_count)
+        self.assertIsNone(self._nirio._batch_library)
+
+    def test_batch_route_signal_raises_on_error(self):
+        self._mock_route_signal.status = -52000
+        with self.assertRaises(nifpga.MemoryFullError):
+            self._nirio.BatchRouteSignal(7, [b"SigIn0", b"SigIn1"],
+                                         [b"ClkOut", b"PXI_Trig0"])
+        self.assertEqual(1, len(self._routes))
+
+    def test_route_session(self):
+        routes = RouteSession(self._nirio, 7)
+        self.assertEqual(1, routes.route("SigIn0", "ClkOut"))
+        self.assertEqual(2, routes.route(b"SigIn0", "PXI_Trig0"))
+        self.assertEqual(3, routes.route("SigIn0", "ClkOut"))
+        self.assertEqual([(7, b"SigIn0", b"ClkOut"),
+                          (7, b"SigIn0", b"PXI_Trig0"),
+                          (7, b"SigIn0", b"ClkOut")], self._routes)
+
+    def test_route_session_encodes_each_terminal_once(self):
+        routes = RouteSession(self._nirio, 7)
+        routes.route("SigIn0", "ClkOut")
+        terminal = routes._terminal("SigIn0")
+        routes.route("SigIn0", "ClkOut")
+        self.assertIs(terminal, routes._terminal("SigIn0"))
+        self.assertEqual(2, len(routes._terminals))
+
+    def test_route_session_raises_on_error(self):
+        self._mock_route_signal.status = -52000
+        routes = RouteSession(self._nirio, 7)
+        with self.assertRaises(nifpga.MemoryFullError):
+            routes.route("SigIn0", "ClkOut")
@@ -2,6 +2,7 @@ import ctypes
 import mock
 import unittest
 import sys
+import threading
 import warnings
 from contextlib import contextmanager
 from nose import SkipTest
@@ -164,6 +165,11 @@ class StatusCheckedLibraryTestCRunTime(unittest.TestCase):
         with self.assertRaises(nifpga.UnknownError):
             self._c_runtime.c_atoi(b"-1")
 
+    def test_prebuilt_function_returns_status_unchecked(self):
+        c_atoi = self._c_runtime._prebuilt["c_atoi"]
+        self.assertEqual([ctypes.c_char_p], c_atoi.argtypes)
+        self.assertEqual(-1, c_atoi(b"-1"))
+
     def test_get_unknown_warning(self):
         with warnings.catch_warnings(record=True) as w:
             self._c_runtime.c_atoi(b"1")
@@ -207,6 +213,116 @@ class StatusCheckedLibraryTestFunctionDoesntExist(unittest.TestCase):
         with self.assertRaises(nifpga.VersionMismatchError):
             self._c_runtime["DoesntExist"](b"0")
 
+    def test_prebuilt_function_returns_version_mismatch(self):
+        self.assertEqual(nifpga.VersionMismatchError.CODE,
+                         self._c_runtime._prebuilt["DoesntExist"](b"0"))
+
+
+class StatusCheckedLibraryTestLazy(unittest.TestCase):
+    """
+    With lazy=True, entry points are only looked up and wrapped the first
+    time they're used.
+    """
+    def setUp(self):
+        self._c_runtime = StatusCheckedLibrary(
+            "c",
+            library_function_infos=[
+                LibraryFunctionInfo(
+                    pretty_name="c_atoi",
+                    name_in_library="atoi",
+                    named_argtypes=[
+                        NamedArgtype("nptr", ctypes.c_char_p),
+                    ]),
+                LibraryFunctionInfo(
+                    pretty_name="DoesntExist",
+                    name_in_library="functionThatDoesntExist",
+                    named_argtypes=[
+                        NamedArgtype("nptr", ctypes.c_char_p),
+                    ])
+            ],
+            lazy=True)
+
+    def test_nothing_resolved_until_used(self):
+        self.assertEqual({}, self._c_runtime._wrapped_functions)
+        self.assertEqual({}, self._c_runtime._prebuilt)
+
+    def test_resolved_by_attribute(self):
+        with self.assertRaises(nifpga.UnknownError):
+            self._c_runtime.c_atoi(b"-1")
+        self.assertEqual(["c_atoi"], list(self._c_runtime._wrapped_functions))
+
+    def test_resolved_by_bracket(self):
+        with self.assertRaises(nifpga.VersionMismatchError):
+            self._c_runtime["DoesntExist"](b"0")
+        self.assertEqual(["DoesntExist"], list(self._c_runtime._wrapped_functions))
+
+    def test_resolved_by_prebuilt(self):
+        self.assertEqual(-1, self._c_runtime._prebuilt["c_atoi"](b"-1"))
+        self.assertIn("c_atoi", self._c_runtime._wrapped_functions)
+
+    def test_resolved_by_prebuilt_get_and_in(self):
+        self.assertIn("c_atoi", self._c_runtime._prebuilt)
+        self.assertIsNotNone(self._c_runtime._prebuilt.get("DoesntExist"))
+        self.assertEqual(["DoesntExist", "c_atoi"], sorted(self._c_runtime._wrapped_functions))
+        self.assertNotIn("NotAFunction", self._c_runtime._prebuilt)
+        self.assertIsNone(self._c_runtime._prebuilt.get("NotAFunction"))
+
+    def test_concurrent_first_use(self):
+        """ Many threads using an entry point for the first time at once
+        should all get the same closure, and none should fail. """
+        library_function_infos = [
+            LibraryFunctionInfo(
+                pretty_name="c_abs",
+                name_in_library="abs",
+                named_argtypes=[
+                    NamedArgtype("j", ctypes.c_int),
+                ])
+        ]
+        # switch threads as often as possible to make any race likely
+        if python_version == 3:
+            switch_interval = sys.getswitchinterval()
+            sys.setswitchinterval(1e-6)
+            self.addCleanup(sys.setswitchinterval, switch_interval)
+        for _ in range(100):
+            c_runtime = StatusCheckedLibrary("c", library_function_infos, lazy=True)
+            start = threading.Event()
+            results = []
+            errors = []
+
+            def first_use_by_bracket():
+                start.wait()
+                try:
+                    results.append(c_runtime["c_abs"])
+                except Exception as e:
+                    errors.append(e)
+
+            def first_use_by_attribute():
+                start.wait()
+                try:
+                    results.append(c_runtime.c_abs)
+                except Exception as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=target)
+                       for target in [first_use_by_bracket, first_use_by_attribute] * 4]
+            for thread in threads:
+                thread.start()
+            start.set()
+            for thread in threads:
+                thread.join()
+            self.assertEqual([], errors)
+            self.assertEqual(8, len(results))
+            for result in results:
+                self.assertIs(c_runtime._wrapped_functions["c_abs"], result)
+
+    def test_unknown_name(self):
+        with self.assertRaises(AttributeError):
+            self._c_runtime.NotAFunction
+        with self.assertRaises(KeyError):
+            self._c_runtime["NotAFunction"]
+        with self.assertRaises(KeyError):
+            self._c_runtime._prebuilt["NotAFunction"]
+
 
 class StatusCheckedLibraryTestMockedLibrary(unittest.TestCase):
     """